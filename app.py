@@ -1,218 +1,420 @@
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import matplotlib.pyplot as plt
-import seaborn as sns
+import plotly.graph_objects as go
 
 # Set page config
 st.set_page_config(page_title="Health Drink Sales Insights", layout="wide")
 
 # Load data
+# Low-cardinality labels as categoricals: isin/groupby then work on small integer codes
+category_columns = ('Gender', 'ProductVariant', 'Location', 'Channel', 'PaymentType', 'CustomerID')
+
+# Convert the CSV into a typed Parquet file: label columns dictionary-encoded, numerics already downcast and rows
+# already in date order, so load_data does not redo these conversions on every cold start
+def convert_source():
+    df = pd.read_csv("Clean Data.csv", parse_dates=['Date'])
+    for c in category_columns:
+        df[c] = df[c].astype('category')
+    # Dashboard figures never need more than float32/int32 precision; half-width columns halve the bytes every reduction reads.
+    # FeedbackScore stays float64: its 0.1-step scores are compared and binned against float64 bounds
+    df = df.astype({'UnitsPurchased': 'int32', 'Age': 'int16', 'UnitPrice': 'float32',
+                    'Total Sale Value': 'float32'})
+    # Keep rows in date order so the date-range filter is a positional slice
+    df = df.sort_values('Date', kind='stable')
+    df.to_parquet("Clean Data.typed.parquet", engine="pyarrow", index=False)
+
 @st.cache_data
 def load_data():
-    df = pd.read_csv("Clean Data.csv", parse_dates=['Date'])
+    # Convert once (and again if the CSV changes); Parquet keeps column types, so Date is not re-parsed
+    if not os.path.exists("Clean Data.typed.parquet") or (
+            os.path.exists("Clean Data.csv") and os.path.getmtime("Clean Data.typed.parquet") < os.path.getmtime("Clean Data.csv")):
+        convert_source()
+    df = pd.read_parquet("Clean Data.typed.parquet", engine="pyarrow")
+    # pyarrow restores only string categoricals; integer ones (e.g. CustomerID) come back as plain integers
+    for c in category_columns:
+        if not isinstance(df[c].dtype, pd.CategoricalDtype):
+            df[c] = df[c].astype('category')
+    # get_filtered's searchsorted needs rows in date order; a file not written by convert_source may not be sorted
+    if not df['Date'].is_monotonic_increasing:
+        df = df.sort_values('Date', kind='stable').reset_index(drop=True)
+    # Calendar and age buckets are fixed per row, so derive them once here rather than on every rerun
+    day_order = ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday']
+    month_order = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']
+    df['DayOfWeek'] = pd.Categorical.from_codes(df['Date'].dt.dayofweek, categories=day_order, ordered=True)
+    df['Month'] = pd.Categorical.from_codes(df['Date'].dt.month - 1, categories=month_order, ordered=True)
+    df['YearMonth'] = df['Date'].values.astype('datetime64[M]')
+    bins = [0, 18, 25, 35, 45, 60, 100]
+    labels = ['<18', '18-25', '26-35', '36-45', '46-60', '60+']
+    df['AgeGroup'] = pd.cut(df['Age'], bins=bins, labels=labels, right=False)
     return df
 
-df = load_data()
+# Filter choices are constants of the dataset, so look them up once rather than on every rerun
+@st.cache_data
+def get_options():
+    df = load_data()
+    return {
+        'Date': (df['Date'].min(), df['Date'].max()),
+        'Gender': df['Gender'].dropna().unique().tolist(),
+        'ProductVariant': df['ProductVariant'].unique().tolist(),
+        'Location': df['Location'].unique().tolist(),
+        'Channel': df['Channel'].unique().tolist(),
+        'PaymentType': df['PaymentType'].unique().tolist(),
+        'FeedbackScore': (float(df['FeedbackScore'].min()), float(df['FeedbackScore'].max())),
+    }
+
+options = get_options()
 
 # --- Sidebar filters ---
 st.sidebar.header("Filter Data")
-date_range = st.sidebar.date_input("Select Date Range", [df['Date'].min(), df['Date'].max()])
-selected_genders = st.sidebar.multiselect("Select Gender", options=df['Gender'].dropna().unique(), default=df['Gender'].dropna().unique())
-selected_products = st.sidebar.multiselect("Product Variant", options=df['ProductVariant'].unique(), default=df['ProductVariant'].unique())
-selected_locations = st.sidebar.multiselect("Location", options=df['Location'].unique(), default=df['Location'].unique())
-selected_channel = st.sidebar.multiselect("Channel", options=df['Channel'].unique(), default=df['Channel'].unique())
-selected_payment = st.sidebar.multiselect("Payment Type", options=df['PaymentType'].unique(), default=df['PaymentType'].unique())
-feedback_min, feedback_max = st.sidebar.slider("Feedback Score Range", float(df['FeedbackScore'].min()), float(df['FeedbackScore'].max()), (float(df['FeedbackScore'].min()), float(df['FeedbackScore'].max())))
+date_range = st.sidebar.date_input("Select Date Range", list(options['Date']))
+selected_genders = st.sidebar.multiselect("Select Gender", options=options['Gender'], default=options['Gender'])
+selected_products = st.sidebar.multiselect("Product Variant", options=options['ProductVariant'], default=options['ProductVariant'])
+selected_locations = st.sidebar.multiselect("Location", options=options['Location'], default=options['Location'])
+selected_channel = st.sidebar.multiselect("Channel", options=options['Channel'], default=options['Channel'])
+selected_payment = st.sidebar.multiselect("Payment Type", options=options['PaymentType'], default=options['PaymentType'])
+feedback_min, feedback_max = st.sidebar.slider("Feedback Score Range", *options['FeedbackScore'], options['FeedbackScore'])
 
 # Filter data
-filtered_df = df[
-    (df['Date'] >= pd.to_datetime(date_range[0])) &
-    (df['Date'] <= pd.to_datetime(date_range[1])) &
-    (df['Gender'].isin(selected_genders)) &
-    (df['ProductVariant'].isin(selected_products)) &
-    (df['Location'].isin(selected_locations)) &
-    (df['Channel'].isin(selected_channel)) &
-    (df['PaymentType'].isin(selected_payment)) &
-    (df['FeedbackScore'] >= feedback_min) &
-    (df['FeedbackScore'] <= feedback_max)
-]
+# Every cached view below is keyed on this tuple, so only a genuine filter change triggers a recompute
+filters = (date_range[0], date_range[1], tuple(selected_genders), tuple(selected_products), tuple(selected_locations),
+           tuple(selected_channel), tuple(selected_payment), feedback_min, feedback_max)
+
+# Row mask for a categorical column: look each row's code up in a per-category "allowed" bitmap
+def category_mask(col, selected):
+    # The extra trailing slot is where code -1 (missing) lands, and it is never allowed
+    allowed = np.zeros(len(col.cat.categories) + 1, dtype=bool)
+    idx = col.cat.categories.get_indexer(list(selected))
+    allowed[idx[idx >= 0]] = True
+    return allowed[col.cat.codes.to_numpy()]
+
+@st.cache_data(max_entries=32)
+def get_filtered(filters):
+    start, end, genders, products, locations, channels, payments, fb_min, fb_max = filters
+    df = load_data()
+    d0, d1 = np.datetime64(pd.to_datetime(start)), np.datetime64(pd.to_datetime(end))
+    # Date is sorted: two binary searches find the range, the remaining predicates only scan that slice
+    dates = df['Date'].values
+    df = df.iloc[np.searchsorted(dates, d0, side='left'):np.searchsorted(dates, d1, side='right')]
+    feedback = df['FeedbackScore'].values
+    mask = np.logical_and.reduce([
+        category_mask(df['Gender'], genders),
+        category_mask(df['ProductVariant'], products),
+        category_mask(df['Location'], locations),
+        category_mask(df['Channel'], channels),
+        category_mask(df['PaymentType'], payments),
+        feedback >= fb_min,
+        feedback <= fb_max,
+    ])
+    return df.iloc[mask]
+
+filtered_df = get_filtered(filters)
+
+# --- Cached aggregations ---
+# Sum `val` per combination of the categorical `keys` in one np.bincount pass over their flattened category codes
+def fast_group_sum(frame, keys, val, observed=True):
+    keys = [keys] if isinstance(keys, str) else list(keys)
+    cols = [frame[k] for k in keys]
+    codes = [c.cat.codes.to_numpy() for c in cols]
+    shape = tuple(len(c.cat.categories) for c in cols)
+    valid = np.logical_and.reduce([c >= 0 for c in codes])
+    flat = np.ravel_multi_index([c[valid] for c in codes], shape)
+    n = int(np.prod(shape))
+    sums = np.bincount(flat, weights=frame[val].to_numpy()[valid], minlength=n)
+    groups = np.flatnonzero(np.bincount(flat, minlength=n)) if observed else np.arange(n)
+    result = {k: c.cat.categories[idx] for k, c, idx in zip(keys, cols, np.unravel_index(groups, shape))}
+    result[val] = sums[groups]
+    return pd.DataFrame(result)
+
+@st.cache_data(max_entries=32)
+def get_monthly_sales(filters):
+    return get_filtered(filters).groupby('YearMonth')['Total Sale Value'].sum().reset_index()
+
+@st.cache_data(max_entries=32)
+def get_sales_by_variant(filters):
+    return fast_group_sum(get_filtered(filters), 'ProductVariant', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_daily_sales(filters):
+    return get_filtered(filters).groupby('Date')['Total Sale Value'].sum().reset_index()
+
+@st.cache_data(max_entries=32)
+def get_day_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'DayOfWeek', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_month_units(filters):
+    return fast_group_sum(get_filtered(filters), 'Month', 'UnitsPurchased', observed=False)
+
+@st.cache_data(max_entries=32)
+def get_day_product_pivot(filters):
+    return (get_filtered(filters).groupby(['DayOfWeek', 'ProductVariant'], observed=True)['Total Sale Value'].sum()
+            .unstack('ProductVariant', fill_value=0))
+
+@st.cache_data(max_entries=32)
+def get_feedback_by_prod(filters):
+    return get_filtered(filters).groupby('ProductVariant', observed=True)['FeedbackScore'].mean().reset_index()
+
+@st.cache_data(max_entries=32)
+def get_age_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'AgeGroup', 'Total Sale Value', observed=False)
+
+@st.cache_data(max_entries=32)
+def get_channel_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'Channel', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_product_channel_sales(filters):
+    return fast_group_sum(get_filtered(filters), ['ProductVariant', 'Channel'], 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_gender_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'Gender', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_location_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'Location', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_payment_sales(filters):
+    return fast_group_sum(get_filtered(filters), 'PaymentType', 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_sales_by_channel_month(filters):
+    return fast_group_sum(get_filtered(filters), ['Channel', 'Month'], 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_avg_sale(filters):
+    return get_filtered(filters).groupby('Channel', observed=True)['Total Sale Value'].mean().reset_index()
+
+@st.cache_data(max_entries=32)
+def get_sales_pay(filters):
+    return fast_group_sum(get_filtered(filters), ['Channel', 'PaymentType'], 'Total Sale Value')
+
+@st.cache_data(max_entries=32)
+def get_corr(filters):
+    cols = ['UnitsPurchased', 'UnitPrice', 'FeedbackScore', 'Total Sale Value', 'Age']
+    # Standardize a float32 matrix once and get every pairwise correlation from a single matmul
+    mat = get_filtered(filters)[cols].to_numpy(dtype=np.float32, copy=True)
+    mat -= mat.mean(axis=0)
+    mat /= mat.std(axis=0)
+    return pd.DataFrame((mat.T @ mat) / mat.shape[0], index=cols, columns=cols)
+
+@st.cache_data(max_entries=32)
+def get_top_cust(filters, n=10):
+    cust_sales = fast_group_sum(get_filtered(filters), 'CustomerID', 'Total Sale Value')
+    sums = cust_sales['Total Sale Value'].to_numpy()
+    # Linear-time selection of the n largest totals; only those n get sorted
+    top = np.argpartition(sums, -n)[-n:] if len(sums) > n else np.arange(len(sums))
+    return cust_sales.iloc[top[np.argsort(sums[top])[::-1]]]
+
+# --- Chart helpers ---
+# Point-level charts get at most n rows; a larger payload only slows the browser without changing the picture
+def sample_for_plot(frame, n=10_000):
+    return frame.sample(n, random_state=0) if len(frame) > n else frame
+
+# Bin on the full data in NumPy and ship only the bar heights. Bin widths are a whole number of the data's
+# resolution (smallest gap between distinct values) and edges sit half a step off the values, so values on a grid
+# such as 0.1-step scores never land on an edge and every bin covers the same number of possible values
+def histogram(frame, x, nbins, title):
+    values = frame[x].to_numpy(dtype=np.float64)
+    distinct = np.unique(values[~np.isnan(values)])
+    step = np.diff(distinct).min() if len(distinct) > 1 else 1.0
+    lo, hi = (distinct[0], distinct[-1]) if len(distinct) else (0.0, 0.0)
+    width = max(1, np.ceil(round((hi - lo) / (nbins * step), 3))) * step
+    counts, edges = np.histogram(values, bins=np.arange(lo - step / 2, hi + width, width))
+    fig = px.bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, labels={'x': x, 'y': 'count'}, title=title)
+    fig.update_layout(bargap=0)
+    return fig
+
+# Fit the least-squares line on the full data, but plot only a sample of the points
+def scatter_with_trend(frame, x, y, title):
+    fig = px.scatter(sample_for_plot(frame), x=x, y=y, title=title)
+    xs, ys = frame[x].to_numpy(dtype=np.float64), frame[y].to_numpy(dtype=np.float64)
+    if len(xs) > 1 and np.ptp(xs) > 0:
+        slope, intercept = np.polyfit(xs, ys, 1)
+        line_x = np.array([xs.min(), xs.max()])
+        fig.add_trace(go.Scatter(x=line_x, y=slope * line_x + intercept, mode='lines', name='OLS trendline', showlegend=False))
+    return fig
+
+# Single-trace line/bar charts keep one figure per session; reruns only swap in the new x/y arrays
+def reused_figure(key, kind, frame, x, y, title):
+    if key not in st.session_state:
+        fig = go.Figure(go.Scatter(mode='lines') if kind == 'line' else go.Bar())
+        fig.update_layout(title=title, xaxis_title=x, yaxis_title=y)
+        st.session_state[key] = fig
+    fig = st.session_state[key]
+    fig.update_traces(x=frame[x].to_numpy(), y=frame[y].to_numpy())
+    return fig
 
 # ---- Main Dashboard ----
 st.title("Health Drink Sales Analytics Dashboard")
 st.markdown("Welcome! This dashboard provides a 360-degree view of factors influencing health drink sales. Use the sidebar to filter and interact with the data. Each chart includes a brief explanation.")
 
-tabs = st.tabs([
-    "Executive Summary", "Sales Trends", "Product Insights", 
+# Only the selected section is computed and rendered on each rerun
+section = st.radio("Section", [
+    "Executive Summary", "Sales Trends", "Product Insights",
     "Customer Insights", "Channel Analysis", "Advanced Analytics"
-])
+], horizontal=True, key='tab')
 
 # -- Tab 1: Executive Summary --
-with tabs[0]:
+if section == "Executive Summary":
     st.subheader("Key Sales Metrics")
     st.markdown("A high-level overview for quick insight into overall performance.")
 
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Sales", f"${filtered_df['Total Sale Value'].sum():,.2f}")
+    col1.metric("Total Sales", f"${filtered_df['Total Sale Value'].to_numpy().sum(dtype=np.float64):,.2f}")
     col2.metric("Total Units Sold", f"{filtered_df['UnitsPurchased'].sum():,.0f}")
-    col3.metric("Unique Customers", filtered_df['CustomerID'].nunique())
+    # Mark each customer's category code in a presence bitmap and count it, instead of hashing IDs with nunique()
+    customer_codes = filtered_df['CustomerID'].cat.codes.to_numpy()
+    seen = np.zeros(len(filtered_df['CustomerID'].cat.categories), dtype=bool)
+    seen[customer_codes[customer_codes >= 0]] = True
+    col3.metric("Unique Customers", int(seen.sum()))
     col4.metric("Avg. Feedback Score", f"{filtered_df['FeedbackScore'].mean():.2f}")
 
     st.markdown("**Monthly Sales Trend:** How sales are evolving over time.")
-    monthly_sales = filtered_df.groupby(filtered_df['Date'].dt.to_period('M')).agg({'Total Sale Value':'sum'}).reset_index()
-    monthly_sales['Date'] = monthly_sales['Date'].astype(str)
-    fig = px.line(monthly_sales, x='Date', y='Total Sale Value', title="Monthly Sales Trend")
+    monthly_sales = get_monthly_sales(filters)
+    monthly_sales['Date'] = monthly_sales['YearMonth'].dt.strftime('%Y-%m')
+    fig = reused_figure('fig_monthly_sales', 'line', monthly_sales, 'Date', 'Total Sale Value', 'Monthly Sales Trend')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Sales by Product Variant:** Snapshot of top-performing products.")
-    sales_by_variant = filtered_df.groupby('ProductVariant')['Total Sale Value'].sum().reset_index()
-    fig = px.bar(sales_by_variant, x='ProductVariant', y='Total Sale Value', title="Sales by Product Variant")
+    sales_by_variant = get_sales_by_variant(filters)
+    fig = reused_figure('fig_sales_by_variant', 'bar', sales_by_variant, 'ProductVariant', 'Total Sale Value', 'Sales by Product Variant')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Sales by Channel:** Where are most of our sales coming from?")
-    fig = px.pie(filtered_df, values='Total Sale Value', names='Channel', title='Sales Distribution by Channel', hole=0.4)
+    fig = px.pie(get_channel_sales(filters), values='Total Sale Value', names='Channel', title='Sales Distribution by Channel', hole=0.4)
     st.plotly_chart(fig, use_container_width=True)
 
 # -- Tab 2: Sales Trends --
-with tabs[1]:
+elif section == "Sales Trends":
     st.subheader("Sales Trends & Seasonality")
     st.markdown("Detailed breakdown of sales over different dimensions to spot patterns and seasonality.")
 
     st.markdown("**Daily Sales Line Plot:** Track daily fluctuations in sales.")
-    daily_sales = filtered_df.groupby('Date')['Total Sale Value'].sum().reset_index()
-    fig = px.line(daily_sales, x='Date', y='Total Sale Value', title='Daily Sales')
+    daily_sales = get_daily_sales(filters)
+    fig = reused_figure('fig_daily_sales', 'line', daily_sales, 'Date', 'Total Sale Value', 'Daily Sales')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Sales by Day of Week:** Identify best and worst performing days.")
-    filtered_df['DayOfWeek'] = filtered_df['Date'].dt.day_name()
-    day_sales = filtered_df.groupby('DayOfWeek')['Total Sale Value'].sum().reset_index()
-    day_order = ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday']
-    day_sales['DayOfWeek'] = pd.Categorical(day_sales['DayOfWeek'], categories=day_order, ordered=True)
-    day_sales = day_sales.sort_values('DayOfWeek')
-    fig = px.bar(day_sales, x='DayOfWeek', y='Total Sale Value', title='Sales by Day of Week')
+    day_sales = get_day_sales(filters)
+    fig = reused_figure('fig_day_sales', 'bar', day_sales, 'DayOfWeek', 'Total Sale Value', 'Sales by Day of Week')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Units Sold by Month:** Seasonality in product demand.")
-    filtered_df['Month'] = filtered_df['Date'].dt.strftime('%b')
-    month_units = filtered_df.groupby('Month')['UnitsPurchased'].sum().reindex(
-        ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']).reset_index()
-    fig = px.bar(month_units, x='Month', y='UnitsPurchased', title='Units Sold by Month')
+    month_units = get_month_units(filters)
+    fig = reused_figure('fig_month_units', 'bar', month_units, 'Month', 'UnitsPurchased', 'Units Sold by Month')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Heatmap of Sales by Day and Product:** Visualize weekly product demand.")
-    pivot = pd.pivot_table(filtered_df, index='DayOfWeek', columns='ProductVariant', values='Total Sale Value', aggfunc='sum')
-    fig, ax = plt.subplots()
-    sns.heatmap(pivot, annot=True, fmt=".0f", cmap='Blues', ax=ax)
-    st.pyplot(fig, use_container_width=True)
+    pivot = get_day_product_pivot(filters)
+    fig = px.imshow(pivot, text_auto='.0f', color_continuous_scale='Blues', aspect='auto', title='Sales by Day and Product')
+    st.plotly_chart(fig, use_container_width=True)
 
 # -- Tab 3: Product Insights --
-with tabs[2]:
+elif section == "Product Insights":
     st.subheader("Product Variant Performance")
     st.markdown("Analyze which product variants drive the most value and why.")
 
     st.markdown("**Sales by Product Variant:** Top and bottom performers.")
+    sales_by_variant = get_sales_by_variant(filters)
     fig = px.bar(sales_by_variant, x='ProductVariant', y='Total Sale Value', color='ProductVariant', title='Sales by Product Variant')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Average Feedback Score by Product:** Customer satisfaction for each variant.")
-    feedback_by_prod = filtered_df.groupby('ProductVariant')['FeedbackScore'].mean().reset_index()
-    fig = px.bar(feedback_by_prod, x='ProductVariant', y='FeedbackScore', title='Avg Feedback Score by Product')
+    feedback_by_prod = get_feedback_by_prod(filters)
+    fig = reused_figure('fig_feedback_by_prod', 'bar', feedback_by_prod, 'ProductVariant', 'FeedbackScore', 'Avg Feedback Score by Product')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Units Sold Distribution per Product:** Spread of sales for each variant.")
-    fig = px.box(filtered_df, x='ProductVariant', y='UnitsPurchased', title='Units Purchased Distribution by Product')
+    fig = px.box(sample_for_plot(filtered_df), x='ProductVariant', y='UnitsPurchased', title='Units Purchased Distribution by Product')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Product Sales by Channel:** Which products sell where?")
-    fig = px.bar(filtered_df, x='ProductVariant', y='Total Sale Value', color='Channel', barmode='group', title='Product Sales by Channel')
+    fig = px.bar(get_product_channel_sales(filters), x='ProductVariant', y='Total Sale Value', color='Channel', barmode='group', title='Product Sales by Channel')
     st.plotly_chart(fig, use_container_width=True)
 
 # -- Tab 4: Customer Insights --
-with tabs[3]:
+elif section == "Customer Insights":
     st.subheader("Customer Demographics & Behaviour")
     st.markdown("Who is buying our drinks and how do their characteristics affect sales?")
 
     st.markdown("**Sales by Age Group:** Are there age trends in consumption?")
-    bins = [0, 18, 25, 35, 45, 60, 100]
-    labels = ['<18', '18-25', '26-35', '36-45', '46-60', '60+']
-    filtered_df['AgeGroup'] = pd.cut(filtered_df['Age'], bins=bins, labels=labels, right=False)
-    age_sales = filtered_df.groupby('AgeGroup')['Total Sale Value'].sum().reset_index()
-    fig = px.bar(age_sales, x='AgeGroup', y='Total Sale Value', title='Sales by Age Group')
+    age_sales = get_age_sales(filters)
+    fig = reused_figure('fig_age_sales', 'bar', age_sales, 'AgeGroup', 'Total Sale Value', 'Sales by Age Group')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Gender-wise Sales:** Distribution between male and female buyers.")
-    fig = px.pie(filtered_df, names='Gender', values='Total Sale Value', title='Sales by Gender', hole=0.3)
+    fig = px.pie(get_gender_sales(filters), names='Gender', values='Total Sale Value', title='Sales by Gender', hole=0.3)
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Location-wise Sales:** Geographical concentration of sales.")
-    fig = px.bar(filtered_df.groupby('Location')['Total Sale Value'].sum().reset_index(), x='Location', y='Total Sale Value', title='Sales by Location')
+    fig = reused_figure('fig_location_sales', 'bar', get_location_sales(filters), 'Location', 'Total Sale Value', 'Sales by Location')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Feedback Score Distribution:** How do customers rate their experience?")
-    fig = px.histogram(filtered_df, x='FeedbackScore', nbins=20, title='Feedback Score Distribution')
+    fig = histogram(filtered_df, 'FeedbackScore', 20, 'Feedback Score Distribution')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Sales by Payment Type:** Customer preferences in payment.")
-    fig = px.bar(filtered_df.groupby('PaymentType')['Total Sale Value'].sum().reset_index(), x='PaymentType', y='Total Sale Value', title='Sales by Payment Type')
+    fig = reused_figure('fig_payment_sales', 'bar', get_payment_sales(filters), 'PaymentType', 'Total Sale Value', 'Sales by Payment Type')
     st.plotly_chart(fig, use_container_width=True)
 
 # -- Tab 5: Channel Analysis --
-with tabs[4]:
+elif section == "Channel Analysis":
     st.subheader("Channel & Payment Analysis")
     st.markdown("Deep dive into how different channels and payment methods drive performance.")
 
     st.markdown("**Sales Split by Channel and Month:** Are there seasonal patterns by channel?")
-    channel_month = filtered_df.copy()
-    channel_month['Month'] = channel_month['Date'].dt.strftime('%b')
-    sales_by_channel_month = channel_month.groupby(['Channel', 'Month'])['Total Sale Value'].sum().reset_index()
+    sales_by_channel_month = get_sales_by_channel_month(filters)
     fig = px.bar(sales_by_channel_month, x='Month', y='Total Sale Value', color='Channel', barmode='group', title='Channel-wise Sales by Month')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Units Sold by Channel:** Which channel sells more units?")
-    fig = px.box(filtered_df, x='Channel', y='UnitsPurchased', title='Units Purchased by Channel')
+    fig = px.box(sample_for_plot(filtered_df), x='Channel', y='UnitsPurchased', title='Units Purchased by Channel')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Average Sale Value per Transaction by Channel:**")
-    avg_sale = filtered_df.groupby('Channel')['Total Sale Value'].mean().reset_index()
-    fig = px.bar(avg_sale, x='Channel', y='Total Sale Value', title='Avg Sale Value per Transaction by Channel')
+    avg_sale = get_avg_sale(filters)
+    fig = reused_figure('fig_avg_sale', 'bar', avg_sale, 'Channel', 'Total Sale Value', 'Avg Sale Value per Transaction by Channel')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Sales by Channel & Payment Type:** How are people paying across channels?")
-    sales_pay = filtered_df.groupby(['Channel', 'PaymentType'])['Total Sale Value'].sum().reset_index()
+    sales_pay = get_sales_pay(filters)
     fig = px.bar(sales_pay, x='Channel', y='Total Sale Value', color='PaymentType', barmode='group', title='Channel vs Payment Type Sales')
     st.plotly_chart(fig, use_container_width=True)
 
 # -- Tab 6: Advanced Analytics --
-with tabs[5]:
+elif section == "Advanced Analytics":
     st.subheader("Advanced Analytics & Correlations")
     st.markdown("Explore relationships between sales drivers and outcomes.")
 
     st.markdown("**Correlation Heatmap:** See how factors move together.")
-    cols = ['UnitsPurchased', 'UnitPrice', 'FeedbackScore', 'Total Sale Value', 'Age']
-    fig, ax = plt.subplots()
-    sns.heatmap(filtered_df[cols].corr(), annot=True, cmap='viridis', ax=ax)
-    st.pyplot(fig, use_container_width=True)
+    fig = px.imshow(get_corr(filters), text_auto='.2f', color_continuous_scale='Viridis', aspect='auto', title='Correlation Heatmap')
+    st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Units Purchased vs. Feedback Score:** Any relationship?")
-    fig = px.scatter(filtered_df, x='FeedbackScore', y='UnitsPurchased', trendline='ols', title='Units Purchased vs Feedback Score')
+    fig = scatter_with_trend(filtered_df, 'FeedbackScore', 'UnitsPurchased', 'Units Purchased vs Feedback Score')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Total Sale Value vs. Age:** Do older customers spend more?")
-    fig = px.scatter(filtered_df, x='Age', y='Total Sale Value', trendline='ols', title='Sale Value vs Age')
+    fig = scatter_with_trend(filtered_df, 'Age', 'Total Sale Value', 'Sale Value vs Age')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Boxplot: Sale Value by Payment Type**")
-    fig = px.box(filtered_df, x='PaymentType', y='Total Sale Value', title='Sale Value Distribution by Payment')
+    fig = px.box(sample_for_plot(filtered_df), x='PaymentType', y='Total Sale Value', title='Sale Value Distribution by Payment')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Top 10 Customers by Sales Value:**")
-    top_cust = filtered_df.groupby('CustomerID')['Total Sale Value'].sum().reset_index().sort_values('Total Sale Value', ascending=False).head(10)
-    fig = px.bar(top_cust, x='CustomerID', y='Total Sale Value', title='Top 10 Customers by Sales')
+    top_cust = get_top_cust(filters)
+    fig = reused_figure('fig_top_cust', 'bar', top_cust, 'CustomerID', 'Total Sale Value', 'Top 10 Customers by Sales')
     st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("**Distribution of Unit Price:**")
-    fig = px.histogram(filtered_df, x='UnitPrice', nbins=20, title='Distribution of Unit Price')
+    fig = histogram(filtered_df, 'UnitPrice', 20, 'Distribution of Unit Price')
     st.plotly_chart(fig, use_container_width=True)
 
 # ---- End of dashboard ----